@@ -8,19 +8,42 @@ for use in pattern learning and analysis.
 
 import os
 import json
+import asyncio
 import time
 import logging
+import threading
 import argparse
+import aiohttp
 import requests
-from typing import List, Dict, Any, Optional, Tuple
+from cachecontrol import CacheControlAdapter
+from cachecontrol.caches.file_cache import FileCache
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+from typing import List, Dict, Any, Optional, Tuple, Callable, BinaryIO
 from concurrent.futures import ThreadPoolExecutor
-from bs4 import BeautifulSoup
 from datetime import datetime
 import xml.etree.ElementTree as ET
 from urllib.parse import urlparse
+from html import unescape
 import re
 import random
-import uuid
+import itertools
+
+# Prefer the Lexbor-backed selectolax parser, fall back to BeautifulSoup
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None  # type: ignore[assignment,misc]
+    from bs4 import BeautifulSoup
+
+# Prefer orjson for decoding the embedded workflow JSON, fall back to the stdlib
+_loads: Callable[[Any], Any]
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    _loads = json.loads
 
 # Setup logging
 logging.basicConfig(
@@ -30,174 +53,433 @@ logging.basicConfig(
 )
 logger = logging.getLogger("gallery_scraper")
 
-def scrape_workflow(workflow_id: str) -> Optional[Dict[str, Any]]:
+# Maximum number of concurrent scraper workers; the connection pool is sized to match
+MAX_WORKERS = 32
+
+# Maximum number of simultaneous connections to n8n.io for the asyncio scraper
+ASYNC_LIMIT_PER_HOST = 16
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Referer": "https://n8n.io/workflows",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    # Only advertises br when a brotli decoder is importable
+    "Accept-Encoding": make_headers(accept_encoding=True)["accept-encoding"],
+    "Cache-Control": "no-cache",
+    "Pragma": "no-cache"
+}
+
+# aiohttp decodes a different set of encodings than urllib3, so let it advertise its own
+ASYNC_HEADERS = {key: value for key, value in DEFAULT_HEADERS.items() if key != "Accept-Encoding"}
+
+# Patterns for locating embedded workflow data
+_WORKFLOW_RE = re.compile(r'window\.__WORKFLOW__\s*=\s*({.*?});', re.DOTALL)
+_NUXT_RE = re.compile(r'window\.__NUXT__\s*=\s*({.*?});', re.DOTALL)
+
+# Patterns for reading page metadata from raw HTML without building a DOM
+_HEAD_END_RE = re.compile(r'</head\s*>', re.IGNORECASE)
+_TITLE_TAG_RE = re.compile(r'<title\b[^>]*>(.*?)</title\s*>', re.IGNORECASE | re.DOTALL)
+_META_TAG_RE = re.compile(r'<meta\b((?:[^>"\']|"[^"]*"|\'[^\']*\')*)>', re.IGNORECASE)
+_ATTR_RE = re.compile(r'([^\s=/>"\']+)(?:\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'>]+)))?')
+
+# On-disk HTTP cache; unchanged pages are revalidated with ETag/Last-Modified
+CACHE_DIR = ".web_cache"
+
+# Source of fill-in IDs for nodes that arrive without one; they only need to be
+# unique within a run, so a counter is used instead of uuid4
+_node_ids = itertools.count()
+
+# Dedicated generator for synthetic workflows, independent of the global random state
+_rng = random.Random()
+
+# Serializes appends to a shared JSONL output file across worker threads
+_write_lock = threading.Lock()
+
+# Shared session so connections to n8n.io are kept alive and reused across workers
+SESSION = requests.Session()
+SESSION.headers.update(DEFAULT_HEADERS)
+SESSION.mount("https://", CacheControlAdapter(
+    cache=FileCache(CACHE_DIR),
+    pool_connections=32,
+    pool_maxsize=MAX_WORKERS,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+))
+
+def _parse_html(html: str) -> Any:
     """
-    Scrape a single workflow by ID with comprehensive data extraction.
+    Parse an HTML document with the fastest available parser.
     """
-    logger.info(f"Scraping workflow ID: {workflow_id}")
+    if LexborHTMLParser is not None:
+        return LexborHTMLParser(html)
+    return BeautifulSoup(html, 'lxml')
+
+def _css(tree: Any, selector: str) -> List[Any]:
+    """
+    Return all elements matching a CSS selector.
+    """
+    if LexborHTMLParser is not None:
+        return tree.css(selector)
+    return tree.select(selector)
+
+def _css_first(tree: Any, selector: str) -> Any:
+    """
+    Return the first element matching a CSS selector, or None.
+    """
+    if LexborHTMLParser is not None:
+        return tree.css_first(selector)
+    return tree.select_one(selector)
+
+def _text(element: Any) -> str:
+    """
+    Return the text content of an element.
+    """
+    if LexborHTMLParser is not None:
+        return element.text()
+    return str(element.string or "")
+
+def _attr(element: Any, name: str) -> Optional[str]:
+    """
+    Return an attribute value of an element, or None if it is missing.
+    """
+    if LexborHTMLParser is not None:
+        return element.attributes.get(name)
+    return element.attrs.get(name)
+
+def _raw_meta_tags(html: str) -> List[Dict[str, str]]:
+    """
+    Return the attributes of every <meta> tag in raw HTML, in document order.
+    """
+    meta_tags: List[Dict[str, str]] = []
+    for meta_match in _META_TAG_RE.finditer(html):
+        attributes: Dict[str, str] = {}
+        for attr_match in _ATTR_RE.finditer(meta_match.group(1)):
+            value = next((group for group in attr_match.groups()[1:] if group is not None), "")
+            # Attribute names are case-insensitive and the first occurrence wins, as in a DOM
+            attributes.setdefault(attr_match.group(1).lower(), unescape(value))
+        meta_tags.append(attributes)
+    return meta_tags
+
+def _extract_raw_metadata(html: str) -> Optional[Tuple[Optional[str], str, List[str], str]]:
+    """
+    Extract title text, description, tags and category from raw HTML.
+    Returns None if the head, title or description tag can't be found.
     
-    try:
-        workflow_url = f"https://n8n.io/workflows/{workflow_id}"
-        
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Referer": "https://n8n.io/workflows",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Cache-Control": "no-cache",
-            "Pragma": "no-cache"
-        }
-        
-        response = requests.get(workflow_url, headers=headers, timeout=30)
-        logger.debug(f"Response status: {response.status_code}")
-        
-        if response.status_code != 200:
-            logger.error(f"Failed to fetch workflow page: {response.status_code}")
-            return None
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        workflow_data = None
+    Only the <head> is searched, so <title> and <meta> text in the body
+    (SVG titles, templates, script strings) is never picked up. Meta tags
+    are matched on the same exact attribute and value as the selectors in
+    _extract_dom_metadata so both paths agree.
+    """
+    head_end = _HEAD_END_RE.search(html)
+    if not head_end:
+        return None
+    head = html[:head_end.start()]
+    
+    title_match = _TITLE_TAG_RE.search(head)
+    meta_tags = _raw_meta_tags(head)
+    meta_desc = next((meta for meta in meta_tags if meta.get("name") == "description"), None)
+    if not title_match or meta_desc is None:
+        return None
+    
+    tags = [
+        meta["content"] for meta in meta_tags
+        if meta.get("property") == "article:tag" and "content" in meta
+    ]
+    category_meta = next((meta for meta in meta_tags if meta.get("property") == "article:section"), None)
+    category = category_meta.get("content", "") if category_meta is not None else ""
+    
+    return unescape(title_match.group(1)), meta_desc.get("content", ""), tags, category
+
+def _extract_dom_metadata(tree: Any) -> Tuple[Optional[str], str, List[str], str]:
+    """
+    Extract title text, description, tags and category from a parsed page.
+    """
+    title_text: Optional[str] = None
+    description: str = ""
+    tags: List[str] = []
+    category: str = ""
+    
+    # Get title
+    title_tag = _css_first(tree, 'title')
+    if title_tag:
+        title_text = _text(title_tag)
+    
+    # Get description
+    meta_desc = _css_first(tree, 'meta[name="description"]')
+    content = _attr(meta_desc, 'content') if meta_desc else None
+    if content is not None:
+        description = content
+    
+    # Get tags and category
+    tag_elements = _css(tree, 'meta[property="article:tag"]')
+    for tag_element in tag_elements:
+        tag = _attr(tag_element, 'content')
+        if tag is not None:
+            tags.append(tag)
+    
+    category_element = _css_first(tree, 'meta[property="article:section"]')
+    content = _attr(category_element, 'content') if category_element else None
+    if content is not None:
+        category = content
+    
+    return title_text, description, tags, category
+
+def parse_workflow_page(workflow_id: str, workflow_url: str, html: str) -> Dict[str, Any]:
+    """
+    Extract workflow data and metadata from a fetched workflow page.
+    """
+    workflow_data: Optional[Dict[str, Any]] = None
+    
+    # Fast path: pull window.__WORKFLOW__ straight out of the raw HTML
+    workflow_text = _WORKFLOW_RE.search(html)
+    if workflow_text:
+        try:
+            workflow_data = _loads(workflow_text.group(1))
+            logger.info("Extracted workflow data from window.__WORKFLOW__")
+        except Exception as e:
+            logger.debug(f"Failed to parse window.__WORKFLOW__ from raw HTML: {str(e)}")
+    
+    tree = None
+    
+    if not workflow_data:
+        tree = _parse_html(html)
         
-        # Method 1: Extract from window.__WORKFLOW__
-        script_tags = soup.find_all('script')
-        for script in script_tags:
-            if script.string and "window.__WORKFLOW__" in script.string:
+        # Otherwise make a single pass over the script tags, trying each method
+        # in turn: window.__WORKFLOW__, then window.__NUXT__, then JSON-LD
+        for script in _css(tree, 'script'):
+            script_text = _text(script)
+            if not script_text:
+                continue
+            
+            # The regex search doubles as the presence check, so each script is scanned once
+            workflow_text = _WORKFLOW_RE.search(script_text)
+            nuxt_text = None if workflow_text else _NUXT_RE.search(script_text)
+            
+            if workflow_text:
                 try:
-                    workflow_text = re.search(r'window\.__WORKFLOW__\s*=\s*({.*?});', script.string, re.DOTALL)
-                    if workflow_text:
-                        workflow_data = json.loads(workflow_text.group(1))
-                        logger.info("Extracted workflow data from window.__WORKFLOW__")
-                        break
+                    workflow_data = _loads(workflow_text.group(1))
+                    logger.info("Extracted workflow data from window.__WORKFLOW__")
                 except Exception as e:
                     logger.warning(f"Failed to parse window.__WORKFLOW__: {str(e)}")
-        
-        # Method 2: Extract from window.__NUXT__
-        if not workflow_data:
-            for script in script_tags:
-                if script.string and "window.__NUXT__" in script.string:
-                    try:
-                        nuxt_text = re.search(r'window\.__NUXT__\s*=\s*({.*?});', script.string, re.DOTALL)
-                        if nuxt_text:
-                            nuxt_data = json.loads(nuxt_text.group(1))
-                            if "data" in nuxt_data:
-                                for data_item in nuxt_data["data"]:
-                                    if isinstance(data_item, dict) and "workflow" in data_item:
-                                        workflow_data = data_item["workflow"]
-                                        logger.info("Extracted workflow data from window.__NUXT__")
-                                        break
-                    except Exception as e:
-                        logger.warning(f"Failed to parse window.__NUXT__: {str(e)}")
-        
-        # Method 3: Extract from JSON-LD
-        if not workflow_data:
-            json_ld = soup.find('script', type='application/ld+json')
-            if json_ld and json_ld.string:
+            
+            elif nuxt_text:
                 try:
-                    ld_data = json.loads(json_ld.string)
+                    nuxt_data = _loads(nuxt_text.group(1))
+                    if "data" in nuxt_data:
+                        for data_item in nuxt_data["data"]:
+                            if isinstance(data_item, dict) and "workflow" in data_item:
+                                workflow_data = data_item["workflow"]
+                                logger.info("Extracted workflow data from window.__NUXT__")
+                                break
+                except Exception as e:
+                    logger.warning(f"Failed to parse window.__NUXT__: {str(e)}")
+            
+            elif _attr(script, 'type') == 'application/ld+json':
+                try:
+                    ld_data = _loads(script_text)
                     if "mainEntity" in ld_data and "code" in ld_data["mainEntity"]:
-                        workflow_data = json.loads(ld_data["mainEntity"]["code"])
+                        workflow_data = _loads(ld_data["mainEntity"]["code"])
                         logger.info("Extracted workflow data from JSON-LD")
                 except Exception as e:
                     logger.warning(f"Failed to parse JSON-LD: {str(e)}")
+            
+            if workflow_data:
+                break
+    
+    # Extract metadata
+    title: str = f"Workflow {workflow_id}"
+    
+    # Fast path: read <title> and <meta> tags straight out of the raw HTML,
+    # falling back to the DOM when the raw patterns can't find what we need
+    page_metadata = _extract_raw_metadata(html)
+    if page_metadata is None:
+        if tree is None:
+            tree = _parse_html(html)
+        page_metadata = _extract_dom_metadata(tree)
+    
+    title_text, description, tags, category = page_metadata
+    
+    if title_text:
+        name, separator, _ = title_text.partition(" | n8n")
+        name = name.strip()
+        if separator and name:
+            title = name
+    
+    # If we couldn't extract workflow data, generate synthetic one
+    if not workflow_data:
+        workflow_data = generate_synthetic_workflow(workflow_id)
+        workflow_data["name"] = title
+    
+    # Enhance node details, noting custom nodes for the stats as we go
+    nodes: List[Dict[str, Any]] = workflow_data.get("nodes", [])
+    has_custom_nodes: bool = False
+    for node in nodes:
+        get = node.get
+        is_custom = get("isCustom", False)
+        if is_custom:
+            has_custom_nodes = True
         
-        # Extract metadata
-        title = f"Workflow {workflow_id}"
-        description = ""
-        tags = []
-        category = ""
+        # Ensure all node fields are present
+        if "id" not in node:
+            node["id"] = f"n_{next(_node_ids):x}"
+        node.setdefault("name", f"Node {get('id', 'unknown')}")
+        node.setdefault("type", "unknown")
+        node.setdefault("parameters", {})
+        node.setdefault("position", [0, 0])
         
-        # Get title
-        title_tag = soup.find('title')
-        if title_tag:
-            title_text = title_tag.text
-            name_match = re.search(r'(.+?)\s*\|\s*n8n', title_text)
-            if name_match:
-                title = name_match.group(1).strip()
+        # Add additional node metadata
+        node["metadata"] = {
+            "description": get("description", ""),
+            "displayName": get("displayName", node["name"]),
+            "version": get("version", "1.0"),
+            "isCustom": is_custom,
+            "credentials": get("credentials", {}),
+        }
+    
+    # Enhance connection details
+    if "connections" in workflow_data:
+        workflow_data["connections"] = {
+            source_node: [
+                {
+                    "node": target.get("node", ""),
+                    "type": target.get("type", "main"),
+                    "index": target.get("index", 0),
+                    "sourceOutput": target.get("sourceOutput", "main"),
+                    "targetInput": target.get("targetInput", "main"),
+                    "metadata": {
+                        "description": target.get("description", ""),
+                        "condition": target.get("condition", None),
+                    }
+                }
+                for target in targets
+            ]
+            for source_node, targets in workflow_data["connections"].items()
+        }
+    
+    # Create complete workflow object
+    now_iso: str = datetime.now().isoformat()
+    workflow_get = workflow_data.get
+    result: Dict[str, Any] = {
+        "id": workflow_id,
+        "name": title,
+        "description": description,
+        "url": workflow_url,
+        "workflow": workflow_data,
+        "metadata": {
+            "url": workflow_url,
+            "title": title,
+            "description": description,
+            "category": category,
+            "tags": tags,
+            "version": workflow_get("version", "1.0"),
+            "created": workflow_get("createdAt", now_iso),
+            "updated": workflow_get("updatedAt", now_iso),
+            "settings": workflow_get("settings", {}),
+            "stats": {
+                "nodeCount": len(nodes),
+                "connectionCount": sum(len(connections) for connections in workflow_get("connections", {}).values()),
+                "hasCustomNodes": has_custom_nodes,
+            },
+            "timestamp": now_iso
+        }
+    }
+    
+    return result
+
+def scrape_workflow(workflow_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Scrape a single workflow by ID with comprehensive data extraction.
+    """
+    logger.info(f"Scraping workflow ID: {workflow_id}")
+    
+    try:
+        workflow_url = f"https://n8n.io/workflows/{workflow_id}"
         
-        # Get description
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        if meta_desc and 'content' in meta_desc.attrs:
-            description = meta_desc.attrs['content']
+        response = SESSION.get(workflow_url, timeout=30)
+        logger.debug(f"Response status: {response.status_code}")
+        
+        if response.status_code != 200:
+            logger.error(f"Failed to fetch workflow page: {response.status_code}")
+            return None
         
-        # Get tags and category
-        tag_elements = soup.find_all('meta', attrs={'property': 'article:tag'})
-        for tag_element in tag_elements:
-            if 'content' in tag_element.attrs:
-                tags.append(tag_element.attrs['content'])
+        # n8n.io serves UTF-8, so decode once instead of letting requests guess the encoding
+        html = response.content.decode('utf-8', 'replace')
+        result = parse_workflow_page(workflow_id, workflow_url, html)
         
-        category_element = soup.find('meta', attrs={'property': 'article:section'})
-        if category_element and 'content' in category_element.attrs:
-            category = category_element.attrs['content']
+        logger.info(f"Successfully processed workflow data for ID {workflow_id}")
+        return result
         
-        # If we couldn't extract workflow data, generate synthetic one
-        if not workflow_data:
-            workflow_data = generate_synthetic_workflow(workflow_id)
-            workflow_data["name"] = title
+    except Exception as e:
+        logger.error(f"Error scraping workflow {workflow_id}: {str(e)}")
+        return None
+
+def scrape_workflows(workflow_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+    """
+    Scrape many workflows with a thread pool no larger than the session's connection pool.
+    """
+    if not workflow_ids:
+        return []
+    
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(workflow_ids))) as executor:
+        return list(executor.map(scrape_workflow, workflow_ids))
+
+def write_result(fp: BinaryIO, result: Dict[str, Any]) -> None:
+    """
+    Append a scraped workflow as one JSON line to a file opened in binary mode.
+    """
+    if orjson is not None:
+        line = orjson.dumps(result, option=orjson.OPT_APPEND_NEWLINE)
+    else:
+        line = (json.dumps(result, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+    
+    with _write_lock:
+        fp.write(line)
+
+def scrape_workflows_to_file(workflow_ids: List[str], output_path: str) -> int:
+    """
+    Scrape many workflows and append each result to a JSONL file as it completes.
+    Returns the number of workflows written.
+    """
+    if not workflow_ids:
+        return 0
+    
+    with open(output_path, 'ab', buffering=1 << 20) as fp:
+        def scrape_and_write(workflow_id: str) -> bool:
+            result = scrape_workflow(workflow_id)
+            if result is None:
+                return False
+            
+            try:
+                write_result(fp, result)
+                return True
+            except Exception as e:
+                logger.error(f"Error writing workflow {workflow_id}: {str(e)}")
+                return False
         
-        # Enhance node details
-        if "nodes" in workflow_data:
-            for node in workflow_data["nodes"]:
-                # Ensure all node fields are present
-                node.setdefault("id", str(uuid.uuid4()))
-                node.setdefault("name", f"Node {node.get('id', 'unknown')}")
-                node.setdefault("type", "unknown")
-                node.setdefault("parameters", {})
-                node.setdefault("position", [0, 0])
-                
-                # Add additional node metadata
-                node["metadata"] = {
-                    "description": node.get("description", ""),
-                    "displayName": node.get("displayName", node["name"]),
-                    "version": node.get("version", "1.0"),
-                    "isCustom": node.get("isCustom", False),
-                    "credentials": node.get("credentials", {}),
-                }
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(workflow_ids))) as executor:
+            return sum(executor.map(scrape_and_write, workflow_ids))
+
+async def scrape_workflow_async(session: aiohttp.ClientSession, workflow_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Scrape a single workflow by ID using a shared aiohttp session.
+    """
+    logger.info(f"Scraping workflow ID: {workflow_id}")
+    
+    try:
+        workflow_url = f"https://n8n.io/workflows/{workflow_id}"
         
-        # Enhance connection details
-        if "connections" in workflow_data:
-            enhanced_connections = {}
-            for source_node, targets in workflow_data["connections"].items():
-                enhanced_connections[source_node] = []
-                for target in targets:
-                    enhanced_target = {
-                        "node": target.get("node", ""),
-                        "type": target.get("type", "main"),
-                        "index": target.get("index", 0),
-                        "sourceOutput": target.get("sourceOutput", "main"),
-                        "targetInput": target.get("targetInput", "main"),
-                        "metadata": {
-                            "description": target.get("description", ""),
-                            "condition": target.get("condition", None),
-                        }
-                    }
-                    enhanced_connections[source_node].append(enhanced_target)
-            workflow_data["connections"] = enhanced_connections
+        async with session.get(workflow_url, timeout=aiohttp.ClientTimeout(total=30)) as response:
+            logger.debug(f"Response status: {response.status}")
+            
+            if response.status != 200:
+                logger.error(f"Failed to fetch workflow page: {response.status}")
+                return None
+            
+            html = (await response.read()).decode('utf-8', 'replace')
         
-        # Create complete workflow object
-        result = {
-            "id": workflow_id,
-            "name": title,
-            "description": description,
-            "url": workflow_url,
-            "workflow": workflow_data,
-            "metadata": {
-                "url": workflow_url,
-                "title": title,
-                "description": description,
-                "category": category,
-                "tags": tags,
-                "version": workflow_data.get("version", "1.0"),
-                "created": workflow_data.get("createdAt", datetime.now().isoformat()),
-                "updated": workflow_data.get("updatedAt", datetime.now().isoformat()),
-                "settings": workflow_data.get("settings", {}),
-                "stats": {
-                    "nodeCount": len(workflow_data.get("nodes", [])),
-                    "connectionCount": sum(len(connections) for connections in workflow_data.get("connections", {}).values()),
-                    "hasCustomNodes": any(node.get("isCustom", False) for node in workflow_data.get("nodes", [])),
-                },
-                "timestamp": datetime.now().isoformat()
-            }
-        }
+        # Parse off the event loop so CPU work doesn't stall other downloads
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(None, parse_workflow_page, workflow_id, workflow_url, html)
         
         logger.info(f"Successfully processed workflow data for ID {workflow_id}")
         return result
@@ -206,22 +488,29 @@ def scrape_workflow(workflow_id: str) -> Optional[Dict[str, Any]]:
         logger.error(f"Error scraping workflow {workflow_id}: {str(e)}")
         return None
 
+async def scrape_workflows_async(workflow_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+    """
+    Scrape many workflows concurrently over a single keep-alive connection pool.
+    """
+    connector = aiohttp.TCPConnector(limit_per_host=ASYNC_LIMIT_PER_HOST, keepalive_timeout=60)
+    async with aiohttp.ClientSession(connector=connector, headers=ASYNC_HEADERS) as session:
+        return await asyncio.gather(*[scrape_workflow_async(session, workflow_id) for workflow_id in workflow_ids])
+
 def generate_synthetic_workflow(workflow_id: str) -> Dict[str, Any]:
     """
     Generate a synthetic workflow structure for testing and fallback.
     """
-    node_types = [
+    node_types: List[str] = [
         "Function", "IF", "Switch", "Set", "Email", "Slack", "HTTP", 
         "Webhook", "Postgres", "MySQL", "MongoDB", "Redis", "S3"
     ]
     
-    num_nodes = random.randint(3, 6)
-    nodes = []
-    connections = {}
+    num_nodes: int = _rng.randint(3, 6)
+    nodes: List[Dict[str, Any]] = []
+    connections: Dict[str, List[Dict[str, Any]]] = {}
     
     # Create nodes
-    for i in range(num_nodes):
-        node_type = random.choice(node_types)
+    for i, node_type in enumerate(_rng.choices(node_types, k=num_nodes)):
         node = {
             "id": f"node_{i}",
             "name": f"{node_type} {i+1}",
@@ -0,0 +1,198 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "python"))
+
+import workflow_gallery_scraper as scraper
+
+NAME_FIRST_HEAD = """
+<title>Sync &amp; Notify | n8n workflow template</title>
+<meta name="description" content="Let's sync &gt; notify">
+<meta property="article:tag" content="Slack">
+<meta property="article:tag" content='CRM'>
+<meta property="article:section" content="Sales">
+"""
+
+CONTENT_FIRST_HEAD = """
+<title>Sync &amp; Notify | n8n workflow template</title>
+<meta content="Let's sync &gt; notify" name="description">
+<meta content="Slack" property="article:tag">
+<meta data-hid="tag" CONTENT='CRM' Property="article:tag">
+<meta content="Sales" property="article:section">
+"""
+
+MIXED_CASE_KEYS_HEAD = """
+<title>Sync &amp; Notify | n8n workflow template</title>
+<meta name="description" content="Let's sync &gt; notify">
+<meta name="Description" content="ignored">
+<meta name="article:tag" content="ignored">
+<meta property="Article:Tag" content="ignored">
+<meta property="article:tag" content="Slack">
+<meta property="article:tag" content="CRM">
+<meta property="article:section" content="Sales">
+"""
+
+WORKFLOW_SCRIPT = '<script>window.__WORKFLOW__ = {"nodes": [], "connections": {}};</script>'
+
+
+@pytest.mark.parametrize(
+    "head",
+    [NAME_FIRST_HEAD, CONTENT_FIRST_HEAD, MIXED_CASE_KEYS_HEAD],
+    ids=["name-first", "content-first", "mixed-case-keys"],
+)
+def test_raw_and_dom_metadata_agree(head):
+    html = f"<html><head>{head}</head><body>{WORKFLOW_SCRIPT}</body></html>"
+
+    raw = scraper._extract_raw_metadata(html)
+    dom = scraper._extract_dom_metadata(scraper._parse_html(html))
+
+    assert raw is not None
+    assert raw == dom
+    assert raw == ("Sync & Notify | n8n workflow template", "Let's sync > notify", ["Slack", "CRM"], "Sales")
+
+    result = scraper.parse_workflow_page("1", "https://n8n.io/workflows/1", html)
+    assert result["name"] == "Sync & Notify"
+    assert result["description"] == "Let's sync > notify"
+    assert result["metadata"]["tags"] == ["Slack", "CRM"]
+    assert result["metadata"]["category"] == "Sales"
+
+
+def test_raw_metadata_defers_to_dom_without_description():
+    html = f"<html><head><title>Only a title | n8n</title></head><body>{WORKFLOW_SCRIPT}</body></html>"
+
+    assert scraper._extract_raw_metadata(html) is None
+
+    result = scraper.parse_workflow_page("1", "https://n8n.io/workflows/1", html)
+    assert result["name"] == "Only a title"
+    assert result["description"] == ""
+
+
+def test_async_headers_leave_accept_encoding_to_aiohttp():
+    assert "Accept-Encoding" in scraper.DEFAULT_HEADERS
+    assert "Accept-Encoding" not in scraper.ASYNC_HEADERS
+    assert scraper.ASYNC_HEADERS["User-Agent"] == scraper.DEFAULT_HEADERS["User-Agent"]
+
+
+def test_raw_metadata_ignores_title_and_meta_outside_head():
+    html = f"""<html><head>
+<title>Parse <b> tags | n8n workflow template</title>
+<meta name="description" content="Head description">
+<meta property="article:tag" content="Slack">
+</head><body>
+<svg><title>Icon</title></svg>
+<script>const tpl = '<meta property="article:tag" content="Body"><meta property="article:section" content="Body">';</script>
+{WORKFLOW_SCRIPT}
+</body></html>"""
+
+    raw = scraper._extract_raw_metadata(html)
+    dom = scraper._extract_dom_metadata(scraper._parse_html(html))
+
+    assert raw == dom
+    assert raw == ("Parse <b> tags | n8n workflow template", "Head description", ["Slack"], "")
+
+
+def test_raw_metadata_defers_to_dom_without_head_end():
+    html = f'<title>No head end | n8n</title><meta name="description" content="d">{WORKFLOW_SCRIPT}'
+
+    assert scraper._extract_raw_metadata(html) is None
+
+    result = scraper.parse_workflow_page("1", "https://n8n.io/workflows/1", html)
+    assert result["name"] == "No head end"
+    assert result["description"] == "d"
+
+
+@pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib-json"])
+def test_scrape_workflows_to_file_writes_one_line_per_result(tmp_path, monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(scraper, "orjson", None)
+
+    results = {
+        "1": {"id": "1", "name": "Café ✓", "workflow": {"nodes": [], "connections": {}}},
+        "2": None,
+        "3": {"id": "3", "name": "Unserializable", "workflow": object()},
+        "4": {"id": "4", "name": "Last", "workflow": {"nodes": [{"id": "a"}]}},
+    }
+    monkeypatch.setattr(scraper, "scrape_workflow", lambda workflow_id: results[workflow_id])
+
+    output_path = tmp_path / "workflows.jsonl"
+    written = scraper.scrape_workflows_to_file(list(results), str(output_path))
+
+    lines = output_path.read_bytes().splitlines()
+    assert written == 2
+    assert len(lines) == 2
+    assert sorted((json.loads(line) for line in lines), key=lambda result: result["id"]) == [results["1"], results["4"]]
+
+
+def test_scrape_workflows_to_file_without_ids_writes_nothing(tmp_path):
+    output_path = tmp_path / "workflows.jsonl"
+
+    assert scraper.scrape_workflows_to_file([], str(output_path)) == 0
+    assert not output_path.exists()
+
+
+def _workflow_page(body):
+    return f"<html><head>{NAME_FIRST_HEAD}</head><body>{body}</body></html>"
+
+
+def _nuxt_script(workflow):
+    return f"<script>window.__NUXT__ = {json.dumps({'data': [{'workflow': workflow}]})};</script>"
+
+
+def _json_ld_script(workflow):
+    ld_data = {"@type": "SoftwareSourceCode", "mainEntity": {"code": json.dumps(workflow)}}
+    return f'<script type="application/ld+json">{json.dumps(ld_data)}</script>'
+
+
+def test_raw_workflow_match_skips_dom_parse(monkeypatch):
+    def fail_parse(html):
+        raise AssertionError("page should not be parsed")
+
+    monkeypatch.setattr(scraper, "_parse_html", fail_parse)
+    workflow = {"name": "From raw", "nodes": [{"id": "a", "name": "A"}], "connections": {}}
+    html = _workflow_page(f"<script>window.__WORKFLOW__ = {json.dumps(workflow)};</script>")
+
+    result = scraper.parse_workflow_page("1", "https://n8n.io/workflows/1", html)
+
+    assert result["workflow"]["name"] == "From raw"
+    assert result["metadata"]["stats"]["nodeCount"] == 1
+    assert result["metadata"]["tags"] == ["Slack", "CRM"]
+
+
+def test_undecodable_raw_workflow_falls_back_to_nuxt():
+    html = _workflow_page(
+        "<script>window.__WORKFLOW__ = {not: json};</script>"
+        + _nuxt_script({"name": "From Nuxt", "nodes": [], "connections": {}})
+    )
+
+    result = scraper.parse_workflow_page("1", "https://n8n.io/workflows/1", html)
+
+    assert result["workflow"]["name"] == "From Nuxt"
+
+
+def test_json_ld_only_page():
+    html = _workflow_page(_json_ld_script({"name": "From JSON-LD", "nodes": [], "connections": {}}))
+
+    result = scraper.parse_workflow_page("1", "https://n8n.io/workflows/1", html)
+
+    assert result["workflow"]["name"] == "From JSON-LD"
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    [(_nuxt_script, _json_ld_script), (_json_ld_script, _nuxt_script)],
+    ids=["nuxt-then-json-ld", "json-ld-then-nuxt"],
+)
+def test_first_script_source_in_document_order_wins(first, second):
+    html = _workflow_page(
+        first({"name": "First", "nodes": [], "connections": {}})
+        + second({"name": "Second", "nodes": [], "connections": {}})
+    )
+
+    result = scraper.parse_workflow_page("1", "https://n8n.io/workflows/1", html)
+
+    assert result["workflow"]["name"] == "First"